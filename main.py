@@ -1,44 +1,55 @@
+import hashlib
+import importlib.util
+import io
+import json
 import logging
+from logging.handlers import TimedRotatingFileHandler
 import sys
 import os
+import re
+import shlex
+import stat
+import subprocess
+import tempfile
+import time
+import zipfile
+import zlib
+from collections.abc import Iterator
+from xml.sax.saxutils import escape, quoteattr
 from pathlib import Path
-import yaml
-import loguru
-from loguru import logger
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pytesseract import image_to_string
-from PIL import Image
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Third-party modules are imported where they are used, so a run that stops at
+# config validation never pays for loading pptx, PIL or pytesseract.
 
 def setup_logger():
     try:
         # Ensure logs directory exists
         os.makedirs("logs", exist_ok=True)
-        
-        # Remove default handler
-        logger.remove()
-        
-        # Configure handlers
-        logger.add(
-            sys.stdout,
-            level="INFO",  # Changed from DEBUG to INFO for console
-            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-            colorize=True
+
+        formatter = logging.Formatter(
+            "%(asctime)s | %(levelname)-8s | %(module)s:%(funcName)s:%(lineno)d - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
         )
 
-        # Add a file logger at DEBUG (more detailed logging for files)
-        logger.add(
-            "logs/applog_{time:YYYY-MM-DD}.log",  # Added date to filename
-            level="DEBUG",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-            rotation="00:00",    # Rotate at midnight
-            retention="30 days", # Increased retention period
-            compression="zip",
-            backtrace=True,     # Enable detailed traceback
-            diagnose=True,      # Enable diagnostic mode
-            enqueue=True        # Thread-safe logging
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+
+        file_handler = TimedRotatingFileHandler(
+            "logs/applog.log",
+            when="midnight",    # Rotate at midnight
+            backupCount=30,     # Keep 30 days
+            encoding="utf-8"
         )
-        
+        file_handler.setFormatter(formatter)
+
+        # INFO keeps third-party DEBUG chatter (e.g. PIL's per-chunk PNG logs) from
+        # being formatted and written for every image
+        logger = logging.getLogger()
+        logger.setLevel(logging.INFO)
+        logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+
         return logger
     except Exception as e:
         print(f"Failed to initialize logger: {e}")
@@ -47,25 +58,75 @@ def setup_logger():
 def load_config(config_file: str) -> dict:
     """
     Loads configuration from a YAML file.
+    The parsed result is cached next to it as JSON and reused until the YAML
+    file's mtime or size changes.
     """
-    if not os.path.isfile(config_file):
+    # One stat() both checks the file and keys the cache below
+    try:
+        st = os.stat(config_file)
+        is_file = stat.S_ISREG(st.st_mode)
+    except OSError:
+        is_file = False
+    if not is_file:
         logging.error(f"Config file '{config_file}' not found.")
         sys.exit(1)
 
+    cache_meta = [st.st_mtime_ns, st.st_size]
+    cache_file = config_file + ".cache.json"
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as file:
+            cached = json.load(file)
+        if cached["_meta"] == cache_meta:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # missing, stale or unreadable cache; parse the YAML instead
+
+    import yaml
+    # libyaml's C parser when PyYAML was built with it
+    yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     try:
         with open(config_file, 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
+            config = yaml.load(file, Loader=yaml_loader)
             if config is None:
                 raise ValueError("Empty or invalid YAML structure.")
     except (yaml.YAMLError, ValueError) as e:
         logging.error(f"Failed to parse YAML config: {e}")
         sys.exit(1)
 
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as file:
+            json.dump({"_meta": cache_meta, "data": config}, file)
+    except (OSError, TypeError, ValueError) as e:
+        # Not fatal; configs with values JSON can't hold (e.g. YAML dates) just go uncached
+        logging.debug(f"Could not write config cache '{cache_file}': {e}")
+        try:
+            os.remove(cache_file)
+        except OSError:
+            pass
+
     return config
 
+# Required 'presentation' keys and the type each is converted to during validation
+PRESENTATION_SCHEMA = {
+    "textbox_left_inches": float,
+    "textbox_top_inches": float,
+    "textbox_width_inches": float,
+    "textbox_height_inches": float,
+    "image_left_inches": float,
+    "image_top_inches": float,
+    "image_scale_percent": float,
+    "text_font_size": float
+}
+
+# LSTM engine only, treating each image as one uniform block of text; skips
+# Tesseract's page layout analysis
+DEFAULT_TESSERACT_CONFIG = "--oem 1 --psm 6"
+
 def validate_config(config: dict) -> None:
     """
-    Validates essential keys and types in the configuration.
+    Validates essential keys and types in the configuration, converting
+    'presentation' values to their schema types in place.
     Exits if required keys are missing or invalid.
     """
     if "paths" not in config:
@@ -86,7 +147,11 @@ def validate_config(config: dict) -> None:
     output_folder = paths["output_folder"]
     output_filename = paths["output_filename"]
 
-    if not os.path.isdir(images_folder):
+    try:
+        is_dir = stat.S_ISDIR(os.stat(images_folder).st_mode)
+    except (OSError, TypeError, ValueError):
+        is_dir = False
+    if not is_dir:
         logging.error(f"Images folder '{images_folder}' does not exist or is not a directory.")
         sys.exit(1)
 
@@ -95,23 +160,12 @@ def validate_config(config: dict) -> None:
         sys.exit(1)
 
     presentation = config["presentation"]
-    required_presentation_keys = [
-        "textbox_left_inches",
-        "textbox_top_inches",
-        "textbox_width_inches",
-        "textbox_height_inches",
-        "image_left_inches",
-        "image_top_inches",
-        "image_scale_percent",
-        "text_font_size"
-    ]
-
-    for key in required_presentation_keys:
+    for key, cast in PRESENTATION_SCHEMA.items():
         if key not in presentation:
             logging.error(f"Missing '{key}' under 'presentation' in config.yaml.")
             sys.exit(1)
         try:
-            float(presentation[key])
+            presentation[key] = cast(presentation[key])
         except (TypeError, ValueError):
             logging.error(f"'{key}' under 'presentation' must be a numerical value.")
             sys.exit(1)
@@ -128,25 +182,475 @@ def validate_config(config: dict) -> None:
                 )
                 sys.exit(1)
 
+    # Validate 'ocr' if present
+    if "ocr" in config:
+        if not isinstance(config["ocr"], dict):
+            logging.error("'ocr' in config.yaml should be a section of OCR settings.")
+            sys.exit(1)
+        tesseract_config = config["ocr"].get("tesseract_config", DEFAULT_TESSERACT_CONFIG)
+        if not isinstance(tesseract_config, str):
+            logging.error("'tesseract_config' under 'ocr' must be a string of Tesseract options.")
+            sys.exit(1)
+        # Split the same way the OCR workers do, so a quoting typo stops the run here
+        try:
+            shlex.split(tesseract_config)
+        except ValueError as e:
+            logging.error(f"Invalid 'tesseract_config' under 'ocr': {e}.")
+            sys.exit(1)
+        # OCR workers fall back to pytesseract silently; warn once here instead
+        if importlib.util.find_spec("tesserocr") is not None:
+            try:
+                _tesserocr_options(tesseract_config)
+            except ValueError as e:
+                logging.warning(
+                    f"tesserocr can't apply 'tesseract_config' ({e}); OCR falls back to pytesseract."
+                )
+
+PAGE_SEPARATOR = "\f"
+
+# Written to the output folder; maps image content hashes to their OCR text
+OCR_CACHE_FILENAME = ".ocr_cache.json"
+# Bumped when cached text changes shape, discarding entries written by older versions
+OCR_CACHE_VERSION = 2
+
+# Upper bound on images OCR'd per Tesseract batch invocation
+OCR_BATCH_SIZE = 16
+
+# Longest side (px) handed to Tesseract; accuracy plateaus around 300 DPI, so
+# anything larger only costs OCR time
+OCR_MAX_DIMENSION = 2400
+
+# 8-bit colour modes converted to grayscale before OCR. 16/32-bit modes (I;16, I, F)
+# are left alone: convert("L") clips their values to 255, leaving a blank page
+GRAYSCALE_CONVERTIBLE_MODES = ("RGB", "CMYK", "YCbCr", "P")
+
+# Per-worker OCR state, set by _init_ocr_worker
+_TESSERACT_CONFIG = DEFAULT_TESSERACT_CONFIG
+# {sha1 of image file: extracted_text} from earlier runs
+_OCR_CACHE = {}
+# In-process Tesseract engine owned by each OCR worker (only when tesserocr is installed)
+_API = None
+
+def _tesserocr_options(tesseract_config: str) -> tuple:
+    """
+    Maps Tesseract command-line options (--psm, --oem, -l, -c name=value) onto
+    PyTessBaseAPI constructor arguments and variables.
+    Returns (kwargs, variables). Raises ValueError for options it can't map.
+    """
+    kwargs = {}
+    variables = {}
+    args = iter(shlex.split(tesseract_config))
+    for arg in args:
+        value = next(args, "")
+        if arg == "--psm":
+            kwargs["psm"] = int(value)
+        elif arg == "--oem":
+            kwargs["oem"] = int(value)
+        elif arg == "-l":
+            kwargs["lang"] = value
+        elif arg == "-c" and "=" in value:
+            name, _, var_value = value.partition("=")
+            variables[name] = var_value
+        else:
+            raise ValueError(f"unsupported option '{arg}'")
+    return kwargs, variables
+
+def _ocr_backend(tesseract_config: str) -> str:
+    """
+    Names the Tesseract backend OCR workers pick for tesseract_config.
+    """
+    if importlib.util.find_spec("tesserocr") is None:
+        return "pytesseract"
+    try:
+        _tesserocr_options(tesseract_config)
+    except ValueError:
+        return "pytesseract"
+    return "tesserocr"
+
+def _init_ocr_worker(tesseract_config: str, ocr_cache: dict) -> None:
+    """
+    Runs once in each OCR worker process before it takes any tasks.
+    """
+    # Tesseract's own OpenMP threads would oversubscribe the cores the pool already uses
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+    global _API, _OCR_CACHE, _TESSERACT_CONFIG
+    _TESSERACT_CONFIG = tesseract_config
+    _OCR_CACHE = ocr_cache
+    try:
+        from tesserocr import PyTessBaseAPI
+    except ImportError:
+        return
+    try:
+        kwargs, variables = _tesserocr_options(tesseract_config)
+        # Loads the traineddata once and keeps it for every image this worker handles
+        api = PyTessBaseAPI(**kwargs)
+        for name, value in variables.items():
+            api.SetVariable(name, value)
+        _API = api
+    except (RuntimeError, ValueError) as e:
+        logging.debug(f"tesserocr unavailable, falling back to pytesseract: {e}")
+
+def _image_to_text(image) -> str:
+    """
+    Runs OCR on a file path or PIL image with whichever Tesseract backend is available.
+    The trailing page separator the CLI appends is dropped so both backends (and batch
+    mode, which splits on it) return the same text.
+    """
+    if _API is None:
+        from pytesseract import image_to_string
+        text = image_to_string(image, config=_TESSERACT_CONFIG)
+    else:
+        if isinstance(image, str):
+            _API.SetImageFile(image)
+        else:
+            _API.SetImage(image)
+        text = _API.GetUTF8Text()
+    return text.removesuffix(PAGE_SEPARATOR)
+
+def _ocr_one(image_path: str) -> tuple:
+    """
+    Performs OCR on a single image inside a worker process.
+    Returns (image_path, extracted_text, size, error); error is None on success.
+    """
+    from PIL import Image
+
+    try:
+        # Opening only parses the header; the pixels are decoded only if we downscale
+        with Image.open(image_path) as img:
+            img.seek(0)  # For multi-frame images
+            size = img.size
+            if max(size) > OCR_MAX_DIMENSION:
+                # Only the OCR input shrinks; the slide still embeds the original file
+                img.thumbnail((OCR_MAX_DIMENSION, OCR_MAX_DIMENSION), Image.Resampling.LANCZOS)
+                # Tesseract works on grayscale anyway; converting first cuts the pixel data
+                # handed to it to a third. Transparent images keep their mode, since
+                # convert("L") would turn transparent areas black.
+                ocr_image = img
+                if img.mode in GRAYSCALE_CONVERTIBLE_MODES and not img.has_transparency_data:
+                    ocr_image = img.convert("L")
+                extracted_text = _image_to_text(ocr_image)
+            elif getattr(img, "n_frames", 1) > 1:
+                # Tesseract would OCR every page of the file; only the first frame is wanted
+                extracted_text = _image_to_text(img)
+            else:
+                # Tesseract reads the file itself, skipping a PIL decode and temp-file round-trip
+                extracted_text = _image_to_text(image_path)
+    except OSError as e:
+        return image_path, None, None, str(e)
+    return image_path, extracted_text, size, None
+
+def _run_tesseract_batch(image_paths: list) -> tuple:
+    """
+    Runs a single Tesseract process over a manifest listing all image_paths.
+    Returns (texts, error): one text per image and None, or None and why the batch run failed.
+    """
+    import pytesseract
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", encoding="utf-8", delete=False) as manifest:
+        manifest.write("".join(os.path.abspath(p) + "\n" for p in image_paths))
+
+    try:
+        completed = subprocess.run(
+            [pytesseract.pytesseract.tesseract_cmd, manifest.name, "stdout",
+             "-c", f"page_separator={PAGE_SEPARATOR}", *shlex.split(_TESSERACT_CONFIG)],
+            capture_output=True
+        )
+    except OSError as e:
+        return None, f"could not start Tesseract: {e}"
+    finally:
+        os.remove(manifest.name)
+
+    if completed.returncode != 0:
+        stderr = completed.stderr.decode("utf-8", errors="replace").strip()
+        return None, f"Tesseract exited with status {completed.returncode}" + (f": {stderr}" if stderr else "")
+
+    # Depending on the Tesseract version the separator follows every page or
+    # only sits between pages; a multi-page image throws the count off entirely.
+    pages = completed.stdout.decode("utf-8", errors="replace").split(PAGE_SEPARATOR)
+    if len(pages) == len(image_paths) + 1 and not pages[-1].strip():
+        pages.pop()
+    if len(pages) != len(image_paths):
+        return None, f"Tesseract returned {len(pages)} pages for {len(image_paths)} images"
+    return pages, None
+
+def _cached_text(image_path: str) -> str | None:
+    """
+    Returns text previously extracted from an image with identical content, if any.
+    """
+    if not _OCR_CACHE:
+        return None
+    with open(image_path, 'rb') as file:
+        digest = hashlib.file_digest(file, "sha1").hexdigest()
+    return _OCR_CACHE.get(digest)
+
+def _ocr_batch(image_paths: list) -> tuple:
+    """
+    Performs OCR on a chunk of images with one Tesseract invocation, so the engine
+    is initialized once per chunk instead of once per image.
+    Images already in the OCR cache are skipped. Falls back to _ocr_one per
+    image if the batch run fails.
+    Returns (results, batch_error); batch_error says why the fallback was needed.
+    """
+    from PIL import Image
+
+    results = {}
+    sizes = {}
+    multi_frame = set()
+    for image_path in image_paths:
+        try:
+            with Image.open(image_path) as img:
+                sizes[image_path] = img.size
+                if getattr(img, "n_frames", 1) > 1:
+                    multi_frame.add(image_path)
+            cached_text = _cached_text(image_path)
+        except OSError as e:
+            results[image_path] = (image_path, None, None, str(e))
+            continue
+        if cached_text is not None:
+            results[image_path] = (image_path, cached_text, sizes[image_path], None)
+
+    pending = [p for p in image_paths if p not in results]
+
+    # The in-process engine is already initialized, so there is nothing to amortize;
+    # oversized images need downscaling first and multi-frame files would add a page
+    # per frame, so they go through _ocr_one as well
+    if _API is None:
+        batch_paths = [
+            p for p in pending if max(sizes[p]) <= OCR_MAX_DIMENSION and p not in multi_frame
+        ]
+    else:
+        batch_paths = []
+    texts, batch_error = _run_tesseract_batch(batch_paths) if batch_paths else (None, None)
+
+    for image_path, text in zip(batch_paths, texts or []):
+        results[image_path] = (image_path, text, sizes[image_path], None)
+    for image_path in pending:
+        if image_path not in results:
+            results[image_path] = _ocr_one(image_path)
+    return [results[p] for p in image_paths], batch_error
+
+def _chunk_results(chunk_outputs) -> Iterator:
+    """
+    Flattens _ocr_batch outputs into per-image results, logging each distinct
+    batch failure once; worker processes' logging doesn't reliably reach the
+    main process's handlers.
+    """
+    reported = set()
+    for results, batch_error in chunk_outputs:
+        if batch_error is not None and batch_error not in reported:
+            reported.add(batch_error)
+            logging.warning(f"Batch OCR failed, OCR'ing images one at a time: {batch_error}")
+        yield from results
+
+def _load_ocr_cache(cache_file: str, cache_meta: list) -> dict:
+    """
+    Loads the {sha1: extracted_text} OCR cache, or an empty one if it is missing
+    or was written with different OCR settings.
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as file:
+            cached = json.load(file)
+        if cached["_meta"] == cache_meta:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # missing, stale or unreadable cache; OCR everything
+    return {}
+
+def _save_ocr_cache(cache_file: str, cache_meta: list, ocr_texts: dict) -> None:
+    """
+    Persists the OCR cache; failures only cost OCR time on the next run.
+    """
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as file:
+            json.dump({"_meta": cache_meta, "data": ocr_texts}, file)
+    except OSError as e:
+        logging.warning(f"Could not write OCR cache '{cache_file}': {e}")
+
+# Shape tree for one slide: the picture plus the OCR textbox, mirroring the XML
+# python-pptx's add_picture/add_textbox would generate, but parsed in one go.
+# The font size is set once as the textbox's level-1 default run properties.
+SLIDE_SHAPES_TEMPLATE = (
+    '<p:spTree'
+    ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+    ' xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+    ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+    '<p:grpSpPr/>'
+    '<p:pic>'
+    '<p:nvPicPr><p:cNvPr id="2" name="Picture 1" descr={pic_descr}/>'
+    '<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+    '<p:blipFill><a:blip r:embed="{pic_rId}"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+    '<p:spPr><a:xfrm><a:off x="{pic_x}" y="{pic_y}"/><a:ext cx="{pic_cx}" cy="{pic_cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr>'
+    '</p:pic>'
+    '<p:sp>'
+    '<p:nvSpPr><p:cNvPr id="3" name="TextBox 2"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{tb_x}" y="{tb_y}"/><a:ext cx="{tb_cx}" cy="{tb_cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr>'
+    '<a:lstStyle><a:lvl1pPr><a:defRPr sz="{tb_sz}"/></a:lvl1pPr></a:lstStyle>'
+    '{text}</p:txBody>'
+    '</p:sp>'
+    '</p:spTree>'
+)
+
+# Control characters XML can't hold; escaped the same way python-pptx does.
+# Vertical tab is left out: python-pptx renders it as a line break
+_CTRL_CHARS = re.compile(r"[\x00-\x08\x0C-\x1F]")
+
+_RUN_OPEN = "<a:r><a:t>"
+_RUN_CLOSE = "</a:t></a:r>"
+
+def _text_paragraphs_xml(text: str) -> str:
+    """
+    Renders text as <a:p> elements, one paragraph per line, with <a:br/> for vertical tabs.
+    Runs carry no properties; the font size comes from the textbox's list style.
+    """
+    # Whole-string passes only: no per-line split, escape or formatting in Python
+    text = _CTRL_CHARS.sub(lambda m: "_x%04X_" % ord(m.group()), escape(text))
+    text = text.replace("\n", _RUN_CLOSE + "</a:p><a:p>" + _RUN_OPEN)
+    text = text.replace("\v", _RUN_CLOSE + "<a:br/>" + _RUN_OPEN)
+    xml = "<a:p>" + _RUN_OPEN + text + _RUN_CLOSE + "</a:p>"
+    # python-pptx adds no empty runs, so blank lines become empty paragraphs
+    return xml.replace(_RUN_OPEN + _RUN_CLOSE, "").replace("<a:p></a:p>", "<a:p/>")
+
+# Empty decks with the slide size preset, one per slide_size_option
+TEMPLATES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# Embedded formats that are already compressed; deflating them again only burns CPU
+STORED_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "gif"})
+
+class _Precompressed:
+    """
+    Compressor stand-in for zipfile that emits a payload deflated ahead of time.
+    """
+    def __init__(self, payload: bytes):
+        self._payload = payload
+
+    def compress(self, data: bytes) -> bytes:
+        payload, self._payload = self._payload, b""
+        return payload
+
+    def flush(self) -> bytes:
+        return b""
+
+def _deflate(blob: bytes) -> bytes:
+    """
+    Raw level-1 deflate, as stored in zip entries. zlib releases the GIL while it works.
+    """
+    compressor = zlib.compressobj(1, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(blob) + compressor.flush()
+
+class _ParallelZipPkgWriter:
+    """
+    Stand-in for python-pptx's _ZipPkgWriter. Collects every part, deflates the
+    compressible ones on a thread pool, then writes the archive in part order;
+    compressed images are stored as-is.
+    """
+    def __init__(self, pkg_file):
+        self._pkg_file = pkg_file
+        self._members = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self._write_archive()
+
+    def write(self, pack_uri, blob: bytes) -> None:
+        stored = pack_uri.ext.lower() in STORED_EXTENSIONS
+        self._members.append((pack_uri.membername, blob, stored))
+
+    def _write_archive(self) -> None:
+        to_deflate = [blob for _, blob, stored in self._members if not stored]
+        with ThreadPoolExecutor() as executor:
+            deflated = iter(list(executor.map(_deflate, to_deflate)))
+
+        date_time = time.localtime()[:6]
+        with zipfile.ZipFile(self._pkg_file, "w", strict_timestamps=False) as zipf:
+            for membername, blob, stored in self._members:
+                zinfo = zipfile.ZipInfo(membername, date_time=date_time)
+                zinfo.external_attr = 0o600 << 16
+                if stored:
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                    zipf.writestr(zinfo, blob)
+                    continue
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                zinfo.file_size = len(blob)  # lets zipfile decide on zip64 up front
+                payload = next(deflated)
+                with zipf.open(zinfo, "w") as entry:
+                    # zipfile still computes the CRC and sizes from the original blob;
+                    # should its private compressor attribute go away, it deflates itself
+                    if hasattr(entry, "_compressor"):
+                        entry._compressor = _Precompressed(payload)
+                    entry.write(blob)
+
+def _save_presentation(presentation, output_path: str) -> None:
+    """
+    Builds the .pptx archive in memory with per-part compression, then writes it to a
+    temporary file beside output_path and renames it into place, so a failed save
+    leaves any existing deck untouched.
+    """
+    buffer = io.BytesIO()
+    try:
+        from pptx.opc.serialized import _PhysPkgWriter
+        original_factory = vars(_PhysPkgWriter)["factory"]
+    except (ImportError, KeyError):
+        # python-pptx internals moved; its own writer still produces the same deck
+        presentation.save(buffer)
+    else:
+        # Swapped in only for this save, so other users of python-pptx are unaffected
+        _PhysPkgWriter.factory = _ParallelZipPkgWriter
+        try:
+            presentation.save(buffer)
+        finally:
+            _PhysPkgWriter.factory = original_factory
+
+    temp_file = tempfile.NamedTemporaryFile(
+        "wb", dir=os.path.dirname(os.path.abspath(output_path)), prefix=".", suffix=".pptx.tmp", delete=False
+    )
+    try:
+        with temp_file:
+            temp_file.write(buffer.getbuffer())
+        # NamedTemporaryFile creates the file owner-only; give the deck the usual permissions
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_file.name, 0o666 & ~umask)
+        os.replace(temp_file.name, output_path)
+    except BaseException:
+        try:
+            os.remove(temp_file.name)
+        except OSError:
+            pass
+        raise
+
 def create_powerpoint_slides(config: dict) -> None:
     """
     Reads image files, performs OCR, and creates a PowerPoint presentation.
     """
+    from pptx import Presentation
+    from pptx.exc import PackageNotFoundError
+    from pptx.oxml import parse_xml
+    from pptx.util import Inches, Pt
+
     images_folder = config["paths"]["images_folder"]
     output_folder = config["paths"]["output_folder"]
     output_filename = config["paths"]["output_filename"]
 
     presentation_cfg = config["presentation"]
 
-    textbox_left = float(presentation_cfg["textbox_left_inches"])
-    textbox_top = float(presentation_cfg["textbox_top_inches"])
-    textbox_width = float(presentation_cfg["textbox_width_inches"])
-    textbox_height = float(presentation_cfg["textbox_height_inches"])
+    # Already converted to floats by validate_config
+    textbox_left = presentation_cfg["textbox_left_inches"]
+    textbox_top = presentation_cfg["textbox_top_inches"]
+    textbox_width = presentation_cfg["textbox_width_inches"]
+    textbox_height = presentation_cfg["textbox_height_inches"]
 
-    image_left = float(presentation_cfg["image_left_inches"])
-    image_top = float(presentation_cfg["image_top_inches"])
-    image_scale_percent = float(presentation_cfg["image_scale_percent"])
-    text_font_size = float(presentation_cfg["text_font_size"])
+    image_left = presentation_cfg["image_left_inches"]
+    image_top = presentation_cfg["image_top_inches"]
+    image_scale_percent = presentation_cfg["image_scale_percent"]
+    text_font_size = presentation_cfg["text_font_size"]
 
     slide_size_option = presentation_cfg.get("slide_size_option", "widescreen").lower()
     size_map = {
@@ -159,84 +663,135 @@ def create_powerpoint_slides(config: dict) -> None:
 
     slide_width, slide_height = size_map[slide_size_option]
     allowed_extensions = [ext.lower() for ext in config.get("extensions", [".png"])]
+    tesseract_config = config.get("ocr", {}).get("tesseract_config", DEFAULT_TESSERACT_CONFIG)
 
     logging.info(f"Images folder: {images_folder}")
     logging.info(f"Output folder: {output_folder}")
     logging.info(f"Output filename: {output_filename}")
     logging.info(f"Allowed extensions: {allowed_extensions}")
+    logging.info(f"Tesseract options: {tesseract_config}")
     logging.info(f"Using slide size: {slide_width}in x {slide_height}in")
 
     os.makedirs(output_folder, exist_ok=True)
     full_output_path = os.path.join(output_folder, output_filename)
 
-    presentation = Presentation()
-    presentation.slide_width = Inches(slide_width)
-    presentation.slide_height = Inches(slide_height)
-
+    # The shipped templates already have the slide size set; fall back to
+    # python-pptx's default deck if they are missing
+    template_path = os.path.join(TEMPLATES_FOLDER, f"template_{slide_size_option}.pptx")
     try:
-        all_files = sorted(os.listdir(images_folder))
+        presentation = Presentation(template_path)
+    except PackageNotFoundError:
+        logging.warning(f"Template '{template_path}' not found. Using the default template.")
+        presentation = Presentation()
+        presentation.slide_width = Inches(slide_width)
+        presentation.slide_height = Inches(slide_height)
+
+    extension_set = frozenset(allowed_extensions)
+    try:
+        with os.scandir(images_folder) as entries:
+            image_entries = [
+                entry for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in extension_set and entry.is_file()
+            ]
     except OSError as e:
         logging.error(f"Error reading images folder '{images_folder}': {e}")
         sys.exit(1)
 
-    image_files = [
-        f for f in all_files
-        if any(f.lower().endswith(ext) for ext in allowed_extensions)
-    ]
+    image_entries.sort(key=lambda entry: entry.name)
+    image_paths = [entry.path for entry in image_entries]
 
-    if not image_files:
+    if not image_paths:
         logging.warning("No valid image files found in the specified folder.")
 
-    for image_file in image_files:
-        image_path = os.path.join(images_folder, image_file)
-        logging.info(f"Processing image: {image_path}")
-
-        try:
-            with Image.open(image_path) as img:
-                img.seek(0)  # handle multi-frame
-                extracted_text = image_to_string(img)
-                orig_width_px, orig_height_px = img.size
-        except OSError as e:
-            logging.error(f"Could not open or read image '{image_path}': {e}")
-            continue
-
-        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
-
-        # Convert px to inches based on 96 dpi assumption or fallback
-        dpi_assumption = 96.0
-        base_width_in = orig_width_px / dpi_assumption
-        base_height_in = orig_height_px / dpi_assumption
-        scale_factor = image_scale_percent / 100.0
-        scaled_width_in = base_width_in * scale_factor
-        scaled_height_in = base_height_in * scale_factor
-
-        try:
-            slide.shapes.add_picture(
-                image_path,
-                Inches(image_left),
-                Inches(image_top),
-                width=Inches(scaled_width_in),
-                height=Inches(scaled_height_in)
+    # OCR dominates the run time, so spread it over all cores. Slides are built on
+    # the main thread (python-pptx objects can't be pickled) while the pool works.
+    max_workers = max(1, min(os.cpu_count() or 1, len(image_paths)))
+    logging.info(f"Running OCR on {len(image_paths)} images with {max_workers} workers")
+
+    # Chunks are OCR'd by a single Tesseract process each; capping their size keeps
+    # results streaming back while later chunks are still being worked on
+    chunk_len = max(1, min(-(-len(image_paths) // max_workers), OCR_BATCH_SIZE))
+    chunks = [image_paths[i:i + chunk_len] for i in range(0, len(image_paths), chunk_len)]
+
+    # Everything below is the same for every slide, so convert it once up front
+    blank_layout = presentation.slide_layouts[6]
+    image_left_emu = Inches(image_left)
+    image_top_emu = Inches(image_top)
+    textbox_left_emu = Inches(textbox_left)
+    textbox_top_emu = Inches(textbox_top)
+    textbox_width_emu = Inches(textbox_width)
+    textbox_height_emu = Inches(textbox_height)
+    font_size = Pt(text_font_size)
+
+    # Convert px to inches based on 96 dpi assumption or fallback
+    dpi_assumption = 96.0
+    scale_factor = image_scale_percent / 100.0
+
+    # Text is cached by image content, so renamed or re-run images skip OCR; the
+    # settings that change OCR output (backend included) invalidate the whole cache
+    ocr_cache_file = os.path.join(output_folder, OCR_CACHE_FILENAME)
+    ocr_cache_meta = [OCR_CACHE_VERSION, _ocr_backend(tesseract_config), tesseract_config, OCR_MAX_DIMENSION]
+    ocr_cache = _load_ocr_cache(ocr_cache_file, ocr_cache_meta)
+    ocr_texts = {}
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_ocr_worker,
+        initargs=(tesseract_config, ocr_cache)
+    ) as executor:
+        results = _chunk_results(executor.map(_ocr_batch, chunks))
+        for image_path, extracted_text, size, error in results:
+            logging.info(f"Processing image: {image_path}")
+
+            if error is not None:
+                logging.error(f"Could not open or read image '{image_path}': {error}")
+                continue
+            orig_width_px, orig_height_px = size
+
+            slide = presentation.slides.add_slide(blank_layout)
+
+            base_width_in = orig_width_px / dpi_assumption
+            base_height_in = orig_height_px / dpi_assumption
+            scaled_width_in = base_width_in * scale_factor
+            scaled_height_in = base_height_in * scale_factor
+
+            try:
+                # Read the file once and embed from memory; its bytes are still in the
+                # page cache from the OCR pass
+                with open(image_path, 'rb') as file:
+                    image_data = file.read()
+                image_part, pic_rId = slide.part.get_or_add_image_part(io.BytesIO(image_data))
+            except OSError as e:
+                logging.error(f"Could not add image '{image_path}' to slide: {e}")
+                continue
+
+            # Build both shapes from the template instead of the python-pptx shape API,
+            # which re-parses XML for every shape and run it touches
+            shapes_xml = SLIDE_SHAPES_TEMPLATE.format(
+                pic_descr=quoteattr(os.path.basename(image_path)),
+                pic_rId=pic_rId,
+                pic_x=image_left_emu,
+                pic_y=image_top_emu,
+                pic_cx=Inches(scaled_width_in),
+                pic_cy=Inches(scaled_height_in),
+                tb_x=textbox_left_emu,
+                tb_y=textbox_top_emu,
+                tb_cx=textbox_width_emu,
+                tb_cy=textbox_height_emu,
+                tb_sz=font_size.centipoints,
+                text=_text_paragraphs_xml(extracted_text)
             )
-        except OSError as e:
-            logging.error(f"Could not add image '{image_path}' to slide: {e}")
-            continue
+            c_sld = slide.element.cSld
+            c_sld.replace(c_sld.spTree, parse_xml(shapes_xml))
 
-        text_box = slide.shapes.add_textbox(
-            Inches(textbox_left),
-            Inches(textbox_top),
-            Inches(textbox_width),
-            Inches(textbox_height)
-        )
-        text_frame = text_box.text_frame
-        text_frame.text = extracted_text
+            # python-pptx already hashed the bytes to de-duplicate image parts
+            ocr_texts[image_part.sha1] = extracted_text
 
-        for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                run.font.size = Pt(text_font_size)
+    # Only this run's images are kept, so the cache doesn't grow without bound
+    _save_ocr_cache(ocr_cache_file, ocr_cache_meta, ocr_texts)
 
     try:
-        presentation.save(full_output_path)
+        _save_presentation(presentation, full_output_path)
         logging.info(f"PowerPoint presentation saved to: {full_output_path}")
     except OSError as e:
         logging.error(f"Failed to save PowerPoint to '{full_output_path}': {e}")